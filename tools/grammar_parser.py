@@ -0,0 +1,752 @@
+#!/usr/bin/env python3
+"""Visitor-helper skeleton generator for the SQL/PL-SQL transformation module.
+
+Parses the ANTLR grammar (PlSqlParser.g4) and emits one Java skeleton class
+per parser rule, following the static-helper pattern used by
+PostgresCodeBuilder (see transformer/builder/Visit*.java):
+
+    public class VisitExit_statement {
+        public static String v(PlSqlParser.Exit_statementContext ctx,
+                               PostgresCodeBuilder b) { ... }
+    }
+
+Each skeleton contains:
+  - one field per child rule reference (context, or List of contexts for
+    repeated elements), with constructor and getters, for helpers that need
+    to carry child context between passes (OuterJoinContext/RownumContext
+    pattern)
+  - a static v(ctx, b) method that null-checks and visits every child, as a
+    starting point for the hand-written transformation
+
+A PostgresCodeBuilderSkeleton class with one @Override visit method per rule
+is generated alongside the helpers.
+
+Output is scratch scaffolding written below target/ (never into src/);
+developers copy a skeleton across when a new rule needs a hand-written
+transformation helper. Repetition inside grouped subrules, e.g.
+(a COMMA b)*, is approximated: an element is treated as a list when it
+carries a * or + suffix or occurs more than once in an alternative.
+
+Usage:
+    python3 tools/grammar_parser.py [--grammar PATH] [--output DIR]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Jinja2 renders the class shell at C speed with a compiled, bytecode-cached
+# template. It stays optional - the repo has no Python dependency management,
+# so the hand-assembled fallback below must keep working without it.
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_DEFAULT_GRAMMAR = (
+    _REPO_ROOT / "src/main/antlr4/me/christianrobert/orapgsync/antlr/PlSqlParser.g4"
+)
+_DEFAULT_OUTPUT = _REPO_ROOT / "target/generated-visitor-skeletons"
+
+_BASE_PACKAGE = "me.christianrobert.orapgsync.transformer.builder"
+
+# Skeleton files are a few KB each; a 64 KB buffer keeps every file to a
+# single write syscall.
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Parallel generation parameters: chunks keep per-task pickling overhead low,
+# and the pool is only worth spinning up for a non-trivial rule count.
+_PARALLEL_CHUNK_SIZE = 32
+_PARALLEL_THRESHOLD = 64
+
+# All patterns are compiled once at module scope; the grammar has ~1000 rules
+# and per-call re.compile churn dominated the profile before this layout.
+# The file-level patterns operate on bytes: the grammar is ASCII, so the
+# whole file is scanned without decoding and only the small captured rule
+# names and bodies are decoded.
+_LINE_COMMENT_RE = re.compile(rb"//[^\n]*")
+_BLOCK_COMMENT_RE = re.compile(rb"/\*.*?\*/", re.DOTALL)
+_OPTIONS_RE = re.compile(rb"\boptions\s*\{[^{}]*\}")
+_RULE_RE = re.compile(rb"^([a-z]\w*)\s*\n\s*:(.*?)\n\s*;", re.MULTILINE | re.DOTALL)
+
+# Alternative labels, actions/predicates, element options and quoted
+# literals are all removed in one combined pass; literals are replaced by a
+# space so they still separate neighbouring elements.
+_STRIP_RE = re.compile(
+    r"(?P<label>#\s*\w+)"
+    r"|(?P<action>\{[^{}]*\}\??)"
+    r"|(?P<option><[^<>]*>)"
+    r"|(?P<literal>'(?:[^'\\]|\\.)*')"
+)
+
+
+def _strip_replacement(match: "re.Match") -> str:
+    return " " if match.lastgroup == "literal" else ""
+
+
+# Element tokenization is the hottest inner loop - it runs over every
+# alternative of every rule. The third-party 'regex' module has a faster
+# C-level matcher for this kind of scan; like Jinja2 it stays optional, with
+# stdlib re as the fallback.
+try:
+    import regex as _regex
+
+    _ELEMENT_RE = _regex.compile(r"\b([a-z]\w*)\b\s*([?*+])?", _regex.VERSION1)
+except ImportError:
+    _ELEMENT_RE = re.compile(r"\b([a-z]\w*)\b\s*([?*+])?")
+
+# Visit-body element templates: every element renders through exactly one of
+# these shapes, so the surrounding Java is interpolated once per element via
+# format_map instead of several f-string appends.
+_VISIT_LIST_TMPL = (
+    "        for (PlSqlParser.{ctx}Context item : ctx.{rule}()) {{\n"
+    "            result.append(b.visit(item));\n"
+    "        }}\n"
+)
+_VISIT_OPT_TMPL = (
+    "        if (ctx.{rule}() != null) {{\n"
+    "            result.append(b.visit(ctx.{rule}()));\n"
+    "        }}\n"
+)
+
+# One builder visit method per rule; rendered as a single fragment so the
+# builder skeleton can be hashed and written without a joined intermediate.
+_BUILDER_METHOD_TMPL = (
+    "    @Override\n"
+    "    public String visit{cap}(PlSqlParser.{cap}Context ctx) {{\n"
+    "        return Visit{cap}.v(ctx, this);\n"
+    "    }}\n\n"
+)
+
+# Single-pass rule classifier combining the skip check and the subpackage
+# mapping: one search per rule name answers both questions via lastgroup.
+# The skip group covers identifier/keyword wrapper rules that
+# PostgresCodeBuilder passes through as text; the remaining group names
+# double as builder subpackage names, mirroring the hand-written layout
+# under transformer/builder/. The alternation order matches the old
+# substring-check priority; on the current grammar leftmost-match and
+# priority order agree for every rule name.
+_CLASSIFIER_RE = re.compile(
+    r"(?P<skip>^(?:non_reserved_keywords_\w+|regular_id|id_expression"
+    r"|identifier|quoted_string|numeric|numeric_negative"
+    r"|native_datatype_element)$)"
+    r"|(?P<connectby>connect|hierarchical)"
+    r"|(?P<cte>factoring)"
+    r"|(?P<outerjoin>outer_join)"
+    r"|(?P<tablereference>table_ref)"
+    r"|(?P<objectfield>object)"
+    r"|(?P<functions>^function|_function$)"
+)
+
+# Placeholder tokens for member-block templates shared between rules with
+# the same field signature; NUL delimiters cannot occur in generated Java.
+_CAP_TOKEN = "\x00CAP\x00"
+_RULE_TOKEN = "\x00RULE\x00"
+
+# slots=True avoids a per-instance __dict__; a large grammar produces tens of
+# thousands of elements, so this cuts both memory and attribute-lookup cost.
+# RuleElement is additionally frozen (and therefore hashable), with the
+# repetition/optionality flags resolved before construction.
+@dataclass(slots=True, frozen=True)
+class RuleElement:
+    """A single child reference inside a grammar alternative."""
+
+    name: str
+    is_list: bool = False
+    is_optional: bool = False
+
+
+@dataclass(slots=True)
+class Alternative:
+    """One top-level alternative of a grammar rule."""
+
+    elements: Tuple[RuleElement, ...] = ()
+
+
+@dataclass(slots=True)
+class GrammarRule:
+    """A parser rule: name plus its top-level alternatives."""
+
+    name: str
+    alternatives: Tuple[Alternative, ...] = ()
+
+
+class GrammarParser:
+    """Extracts parser rules from an ANTLR4 parser grammar file."""
+
+    def __init__(self, grammar_path):
+        self.grammar_path = Path(grammar_path)
+
+    def parse(self) -> Dict[str, GrammarRule]:
+        """Parses the grammar and returns rules keyed by rule name."""
+        source = self.grammar_path.read_bytes()
+        source = _BLOCK_COMMENT_RE.sub(b"", source)
+        source = _LINE_COMMENT_RE.sub(b"", source)
+        source = _OPTIONS_RE.sub(b"", source)
+
+        rules: Dict[str, GrammarRule] = {}
+        for match in _RULE_RE.finditer(source):
+            name = match.group(1).decode("ascii")
+            body = self._strip_labels(match.group(2).decode("ascii"))
+            alternatives = tuple(
+                Alternative(elements=self._parse_elements(alt_text))
+                for alt_text in self._split_alternatives(body)
+            )
+            rules[name] = GrammarRule(name=name, alternatives=alternatives)
+        return rules
+
+    def _strip_labels(self, body: str) -> str:
+        """Removes alternative labels, actions, predicates and literals.
+
+        A single combined pattern walks the body once instead of one full
+        scan per construct kind.
+        """
+        return _STRIP_RE.sub(_strip_replacement, body)
+
+    def _split_alternatives(self, body: str) -> List[str]:
+        """Splits a rule body on top-level '|' (depth 0 only).
+
+        Instead of visiting every character, str.find jumps directly between
+        the structural characters '(', ')' and '|'; everything in between is
+        sliced wholesale. Rule bodies are overwhelmingly plain text, so the
+        scan touches only a handful of positions per rule.
+        """
+        alternatives = []
+        depth = 0
+        start = 0
+        next_pipe = body.find("|")
+        next_open = body.find("(")
+        next_close = body.find(")")
+        while True:
+            candidates = [c for c in (next_pipe, next_open, next_close) if c >= 0]
+            if not candidates:
+                break
+            i = min(candidates)
+            ch = body[i]
+            if ch == "(":
+                depth += 1
+                next_open = body.find("(", i + 1)
+            elif ch == ")":
+                depth -= 1
+                next_close = body.find(")", i + 1)
+            else:
+                if depth == 0:
+                    alternatives.append(body[start:i])
+                    start = i + 1
+                next_pipe = body.find("|", i + 1)
+        alternatives.append(body[start:])
+        return [alt.strip() for alt in alternatives if alt.strip()]
+
+    def _parse_elements(self, alt_text: str) -> Tuple[RuleElement, ...]:
+        """Tokenizes one alternative into rule-reference elements.
+
+        Token references are ALL_CAPS and therefore never match; only
+        lowercase rule references are collected. A repeated reference within
+        the same alternative is promoted to a list.
+        """
+        flags: Dict[str, List[bool]] = {}
+        for match in _ELEMENT_RE.finditer(alt_text):
+            name, suffix = match.group(1), match.group(2)
+            entry = flags.get(name)
+            if entry is None:
+                flags[name] = [suffix in ("*", "+"), suffix == "?"]
+            else:
+                entry[0] = True
+        return tuple(
+            RuleElement(name=name, is_list=is_list, is_optional=is_optional)
+            for name, (is_list, is_optional) in flags.items()
+        )
+
+
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+_JINJA_ENV = None
+
+
+def _get_template(name: str):
+    """Returns a compiled Jinja2 template, building the environment lazily.
+
+    The FileSystemBytecodeCache persists compiled templates across runs, so
+    repeated invocations skip template parsing entirely.
+    """
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        _JINJA_ENV = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(_TEMPLATE_DIR)),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+        )
+    return _JINJA_ENV.get_template(name)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _write_if_changed(path: Path, src: str) -> bool:
+    """Writes src to path unless the file already has identical content.
+
+    Skipping unchanged files keeps their mtimes stable, so downstream
+    incremental compilation is not invalidated by a no-op regeneration.
+    Actual writes go through a temp file plus os.replace to stay atomic.
+    """
+    data = src.encode()
+    try:
+        if _digest(path.read_bytes()) == _digest(data):
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _write_fragments_if_changed(path: Path, fragments) -> bool:
+    """Streaming variant of _write_if_changed for large generated files.
+
+    Hashes the fragments incrementally, compares against the existing file,
+    and on change writes them with writelines through a buffered handle -
+    the full content never exists as one joined string.
+    """
+    encoded = [fragment.encode() for fragment in fragments]
+    hasher = hashlib.blake2b(digest_size=16)
+    for fragment in encoded:
+        hasher.update(fragment)
+    try:
+        if _digest(path.read_bytes()) == hasher.digest():
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.writelines(encoded)
+    os.replace(tmp_path, path)
+    return True
+
+
+_STAMP_FILE_NAME = ".generation-stamp"
+
+
+def _outputs_up_to_date(grammar_path: Path, out_dir: Path) -> bool:
+    """True when nothing changed since the last completed generation.
+
+    Compares the grammar's mtime (and this script's own, since a generator
+    change must also trigger a rebuild) against a stamp file touched after
+    each run. A stamp is used instead of the generated files' own mtimes
+    because unchanged files deliberately keep their old timestamps.
+    """
+    try:
+        stamp_mtime = (out_dir / _STAMP_FILE_NAME).stat().st_mtime
+        input_mtime = max(
+            grammar_path.stat().st_mtime, Path(__file__).stat().st_mtime
+        )
+    except OSError:
+        return False
+    return input_mtime < stamp_mtime
+
+
+def _touch_stamp(out_dir: Path) -> None:
+    (out_dir / _STAMP_FILE_NAME).touch()
+
+
+def _cap(rule_name: str) -> str:
+    """ANTLR context naming: first letter upper, rest untouched."""
+    return rule_name[0].upper() + rule_name[1:]
+
+
+def _camel(rule_name: str) -> str:
+    """snake_case rule name to lowerCamelCase Java field name."""
+    head, *tail = rule_name.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
+class JavaSkeletonGenerator:
+    """Renders Java skeleton classes from parsed grammar rules."""
+
+    def __init__(self, rules: Dict[str, GrammarRule]):
+        self.rules = rules
+        # Classify every rule once up front; one scanner pass per name
+        # yields both the skip decision (None) and the subpackage.
+        self._rule_class = {name: self._classify_rule(name) for name in rules}
+        # Field-type strings repeat heavily across rules (the same child
+        # rules appear everywhere); cache them by (name, is_list) and intern
+        # the result so each distinct type string is allocated once.
+        self._type_cache: Dict[Tuple[str, bool], str] = {}
+        # Rendered member blocks keyed by field signature; see
+        # _generate_members.
+        self._member_cache: Dict[Tuple, str] = {}
+
+    @staticmethod
+    def _classify_rule(rule_name: str):
+        """None when the rule is skipped, otherwise its subpackage ('' = base)."""
+        match = _CLASSIFIER_RE.search(rule_name)
+        if match is None:
+            return ""
+        return None if match.lastgroup == "skip" else match.lastgroup
+
+    def _determine_subdir(self, rule_name: str) -> str:
+        """Maps a rule to a builder subpackage, mirroring the hand-written
+        layout under transformer/builder/."""
+        return self._rule_class[rule_name]
+
+    def _merged_elements(self, rule: GrammarRule) -> List[RuleElement]:
+        """Merges elements across alternatives, preserving first-seen order."""
+        flags: Dict[str, List[bool]] = {}
+        for alternative in rule.alternatives:
+            for element in alternative.elements:
+                entry = flags.get(element.name)
+                if entry is None:
+                    flags[element.name] = [element.is_list, element.is_optional]
+                elif element.is_list:
+                    entry[0] = True
+        return [
+            RuleElement(name=name, is_list=is_list, is_optional=is_optional)
+            for name, (is_list, is_optional) in flags.items()
+        ]
+
+    def _field_type(self, element: RuleElement) -> str:
+        """Java type for a field element, cached across all rules."""
+        key = (element.name, element.is_list)
+        java_type = self._type_cache.get(key)
+        if java_type is None:
+            java_type = f"PlSqlParser.{_cap(element.name)}Context"
+            if element.is_list:
+                java_type = f"List<{java_type}>"
+            java_type = sys.intern(java_type)
+            self._type_cache[key] = java_type
+        return java_type
+
+    def _field_elements(self, rule: GrammarRule) -> List[RuleElement]:
+        """Merged elements restricted to known parser rules.
+
+        Computed once per rule in _generate_class and handed to the four
+        member generators, which previously each re-merged and re-filtered
+        the same element list.
+        """
+        return [e for e in self._merged_elements(rule) if e.name in self.rules]
+
+    def _generate_fields(self, fields: List[RuleElement]) -> str:
+        parts: List[str] = []
+        for element in fields:
+            java_type = self._field_type(element)
+            parts.append(f"    private final {java_type} {_camel(element.name)};\n")
+        if fields:
+            parts.append("\n")
+        return "".join(parts)
+
+    def _generate_constructor(self, fields: List[RuleElement], cap: str) -> str:
+        if not fields:
+            return ""
+        params = []
+        for element in fields:
+            params.append(f"{self._field_type(element)} {_camel(element.name)}")
+        parts: List[str] = []
+        parts.append(f"    public Visit{cap}({', '.join(params)}) {{\n")
+        for element in fields:
+            name = _camel(element.name)
+            parts.append(f"        this.{name} = {name};\n")
+        parts.append("    }\n\n")
+        return "".join(parts)
+
+    def _generate_getters(self, fields: List[RuleElement]) -> str:
+        parts: List[str] = []
+        for element in fields:
+            java_type = self._field_type(element)
+            name = _camel(element.name)
+            getter = "get" + name[0].upper() + name[1:]
+            parts.append(f"    public {java_type} {getter}() {{\n")
+            parts.append(f"        return {name};\n")
+            parts.append("    }\n\n")
+        return "".join(parts)
+
+    def _generate_visit_body(
+        self, fields: List[RuleElement], cap: str, rule_name: str
+    ) -> str:
+        parts: List[str] = []
+        parts.append("    /**\n")
+        parts.append(f"     * Transforms {rule_name} to PostgreSQL syntax.\n")
+        parts.append("     *\n")
+        parts.append(f"     * @param ctx {rule_name} parse tree context\n")
+        parts.append("     * @param b PostgresCodeBuilder instance (for visiting children)\n")
+        parts.append("     * @return PostgreSQL fragment\n")
+        parts.append("     */\n")
+        parts.append(
+            f"    public static String v(PlSqlParser.{cap}Context ctx, PostgresCodeBuilder b) {{\n"
+        )
+        parts.append("        StringBuilder result = new StringBuilder();\n")
+        for element in fields:
+            template = _VISIT_LIST_TMPL if element.is_list else _VISIT_OPT_TMPL
+            parts.append(
+                template.format_map(
+                    {"ctx": _cap(element.name), "rule": element.name}
+                )
+            )
+        parts.append(f"        // TODO: assemble PostgreSQL output for {rule_name}\n")
+        parts.append("        return result.toString();\n")
+        parts.append("    }\n")
+        return "".join(parts)
+
+    def _generate_members(self, rule: GrammarRule, fields: List[RuleElement]) -> str:
+        """Renders the member block, deduplicating identical shapes.
+
+        Many trivial rules (aliases, wrappers) share the exact same field
+        signature; their member blocks differ only in the class and rule
+        name. The block is rendered once per signature with placeholder
+        tokens and instantiated per rule with two replacements.
+        """
+        signature = tuple((element.name, element.is_list) for element in fields)
+        template = self._member_cache.get(signature)
+        if template is None:
+            template = "".join(
+                (
+                    self._generate_fields(fields),
+                    self._generate_constructor(fields, _CAP_TOKEN),
+                    self._generate_getters(fields),
+                    self._generate_visit_body(fields, _CAP_TOKEN, _RULE_TOKEN),
+                )
+            )
+            self._member_cache[signature] = template
+        return template.replace(_CAP_TOKEN, _cap(rule.name)).replace(
+            _RULE_TOKEN, rule.name
+        )
+
+    def _generate_class(self, rule: GrammarRule):
+        """Returns (subdir, filename, java source) for one rule."""
+        cap = _cap(rule.name)
+        subdir = self._determine_subdir(rule.name)
+        package = _BASE_PACKAGE + ("." + subdir if subdir else "")
+        fields = self._field_elements(rule)
+        has_list = any(e.is_list for e in fields)
+        members = self._generate_members(rule, fields)
+
+        if jinja2 is not None:
+            src = _get_template("visit_helper.java.j2").render(
+                package=package,
+                base_package=_BASE_PACKAGE,
+                subdir=subdir,
+                has_list=has_list,
+                rule_name=rule.name,
+                class_name=cap,
+                members=members,
+            )
+        else:
+            src = self._render_class_shell(
+                package, subdir, has_list, rule.name, cap, members
+            )
+        return subdir, f"Visit{cap}.java", src
+
+    def _render_class_shell(
+        self, package, subdir, has_list, rule_name, cap, members
+    ) -> str:
+        """Fallback shell rendering when Jinja2 is not installed.
+
+        Must produce byte-identical output to visit_helper.java.j2.
+        """
+        parts: List[str] = []
+        parts.append(f"package {package};\n\n")
+        parts.append("import me.christianrobert.orapgsync.antlr.PlSqlParser;\n")
+        if subdir:
+            parts.append(f"import {_BASE_PACKAGE}.PostgresCodeBuilder;\n")
+        if has_list:
+            parts.append("\nimport java.util.List;\n")
+        parts.append("\n")
+        parts.append("/**\n")
+        parts.append(f" * Static helper skeleton for visiting {rule_name}.\n")
+        parts.append(" *\n")
+        parts.append(" * <p>Generated by tools/grammar_parser.py - fill in the transformation\n")
+        parts.append(" * logic and move the class into the builder package.</p>\n")
+        parts.append(" */\n")
+        parts.append(f"public class Visit{cap} {{\n\n")
+        parts.append(members)
+        parts.append("}\n")
+        return "".join(parts)
+
+    def _generate_builder_fragments(self, names: List[str]):
+        """Yields the PostgresCodeBuilderSkeleton source as fragments.
+
+        names must already be sorted and filtered; generate_all sorts the
+        rule set exactly once and shares the result. Yielding one fragment
+        per visit method lets the caller hash and write the ~1200-method
+        file without ever materializing it as a single string.
+        """
+        yield (
+            f"package {_BASE_PACKAGE};\n\n"
+            "import me.christianrobert.orapgsync.antlr.PlSqlParser;\n"
+            "import me.christianrobert.orapgsync.antlr.PlSqlParserBaseVisitor;\n\n"
+            "/**\n"
+            " * Generated visitor skeleton delegating every rule to its Visit helper.\n"
+            " *\n"
+            " * <p>Generated by tools/grammar_parser.py - reference only, the real\n"
+            " * dispatch lives in PostgresCodeBuilder.</p>\n"
+            " */\n"
+            "public class PostgresCodeBuilderSkeleton extends PlSqlParserBaseVisitor<String> {\n\n"
+        )
+        for name in names:
+            yield _BUILDER_METHOD_TMPL.format_map({"cap": _cap(name)})
+        yield "}\n"
+
+    def generate_all(self, out_dir, jobs: int = 1, jar_path=None):
+        """Writes all skeleton classes below out_dir.
+
+        Returns (generated, skipped) counts; skipped files already had
+        identical content on disk.
+
+        Each target subdirectory is created exactly once up front. Rule
+        generation is embarrassingly parallel (each rule's output depends
+        only on that rule), so with jobs > 1 the rules are fanned out in
+        chunks to a process pool; each worker renders and writes its own
+        files. The builder skeleton is a single file and stays in the main
+        process.
+        """
+        out_dir = Path(out_dir)
+        names = [
+            name
+            for name in sorted(self.rules)
+            if self._rule_class[name] is not None
+        ]
+
+        if jar_path is not None:
+            return self._generate_jar(Path(jar_path), names)
+
+        subdirs = {self._determine_subdir(name) for name in names} | {""}
+        for subdir in subdirs:
+            os.makedirs(out_dir / subdir if subdir else out_dir, exist_ok=True)
+
+        if jobs > 1 and len(names) >= _PARALLEL_THRESHOLD:
+            chunks = [
+                names[i : i + _PARALLEL_CHUNK_SIZE]
+                for i in range(0, len(names), _PARALLEL_CHUNK_SIZE)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self.rules, out_dir),
+            ) as executor:
+                written = sum(executor.map(_generate_chunk, chunks))
+        else:
+            written = _write_classes(self, out_dir, names)
+
+        builder_fragments = self._generate_builder_fragments(names)
+        if _write_fragments_if_changed(
+            out_dir / "PostgresCodeBuilderSkeleton.java", builder_fragments
+        ):
+            written += 1
+        generated = len(names) + 1
+        return generated, generated - written
+
+
+    def _generate_jar(self, jar_path: Path, names: List[str]):
+        """Emits all skeletons into one ZIP archive instead of a file tree.
+
+        Thousands of tiny .java files are dominated by directory-entry and
+        inode overhead; a single archive needs one write per entry and no
+        mkdir/stat calls. Entries are laid out as package paths so the
+        archive is usable as a source jar.
+        """
+        base = _BASE_PACKAGE.replace(".", "/")
+        os.makedirs(jar_path.parent, exist_ok=True)
+        with zipfile.ZipFile(jar_path, "w", zipfile.ZIP_STORED) as zf:
+            for name in names:
+                subdir, filename, src = self._generate_class(self.rules[name])
+                prefix = f"{base}/{subdir}" if subdir else base
+                zf.writestr(f"{prefix}/{filename}", src)
+            with zf.open(f"{base}/PostgresCodeBuilderSkeleton.java", "w") as fh:
+                fh.writelines(
+                    fragment.encode()
+                    for fragment in self._generate_builder_fragments(names)
+                )
+        return len(names) + 1, 0
+
+
+# Per-process state for parallel generation; set up once per worker via the
+# pool initializer so rule data is serialized per worker, not per chunk.
+_worker_generator = None
+_worker_out_dir = None
+
+
+def _init_worker(rules, out_dir):
+    global _worker_generator, _worker_out_dir
+    _worker_generator = JavaSkeletonGenerator(rules)
+    _worker_out_dir = Path(out_dir)
+
+
+def _generate_chunk(names: List[str]) -> int:
+    """Renders and writes one chunk of rules inside a worker process."""
+    return _write_classes(_worker_generator, _worker_out_dir, names)
+
+
+def _write_classes(generator, out_dir: Path, names: List[str]) -> int:
+    written = 0
+    for name in names:
+        subdir, filename, src = generator._generate_class(generator.rules[name])
+        dir_path = out_dir / subdir if subdir else out_dir
+        if _write_if_changed(dir_path / filename, src):
+            written += 1
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate Visit* helper skeletons from PlSqlParser.g4"
+    )
+    parser.add_argument(
+        "--grammar",
+        default=str(_DEFAULT_GRAMMAR),
+        help="path to the ANTLR parser grammar",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(_DEFAULT_OUTPUT),
+        help="directory for the generated skeleton classes",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes for rule generation (1 = serial)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate even when the grammar is unchanged",
+    )
+    parser.add_argument(
+        "--jar",
+        metavar="PATH",
+        help="emit all skeletons into a single jar/zip archive instead of a file tree",
+    )
+    args = parser.parse_args(argv)
+
+    grammar_path = Path(args.grammar)
+    out_dir = Path(args.output)
+    if args.jar is None and not args.force and _outputs_up_to_date(grammar_path, out_dir):
+        print("Skeleton classes are up to date (use --force to regenerate)")
+        return
+
+    rules = GrammarParser(grammar_path).parse()
+    generator = JavaSkeletonGenerator(rules)
+    generated, skipped = generator.generate_all(
+        out_dir, jobs=args.jobs, jar_path=args.jar
+    )
+    if args.jar is None:
+        _touch_stamp(out_dir)
+    print(
+        f"Generated {generated} skeleton classes from {len(rules)} parser rules"
+        f" ({skipped} unchanged, not rewritten)"
+    )
+
+
+if __name__ == "__main__":
+    main()